@@ -0,0 +1,112 @@
+"""
+Small numeric kernels shared by the fixer and friends.
+
+They are compiled with numba when it is installed; otherwise the same
+functions run as plain Python so numba stays an optional dependency.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # Support both ``@njit`` and ``@njit(...)`` as a no-op decorator.
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Bits reported by fix_pair, in the order the fixes are applied.
+FLAG_SWAP = 1
+FLAG_WRAP = 2
+FLAG_LAT_OUT = 4
+FLAG_LON_OUT = 8
+FLAG_LAT_CLIP = 16
+FLAG_LON_CLIP = 32
+
+
+@njit(cache=True)
+def fix_pair(lat, lon, fb_lat, fb_lon, max_abs, clip):
+    """
+    Repair one numeric lat/lon pair.
+
+    Applies axis swap, longitude wrap, outlier replacement and clipping
+    (in that order) and returns ``(lat, lon, flags)`` where ``flags`` is a
+    bitmask of the ``FLAG_*`` values that fired. Pass ``math.inf`` as
+    ``max_abs`` to disable the outlier guard.
+    """
+    flags = 0
+
+    # Lat in longitude-like range and lon in latitude-like range is a common swap signal.
+    if math.fabs(lat) > 90 and math.fabs(lat) <= 180 and math.fabs(lon) <= 90:
+        lat, lon = lon, lat
+        flags |= FLAG_SWAP
+
+    # Convert 0–360 style longitudes to -180–180 so they can be clipped/validated.
+    if not (-180 <= lon <= 180) and -360 <= lon <= 360:
+        lon = lon - 360.0 * math.floor((lon + 180) / 360)
+        flags |= FLAG_WRAP
+
+    # Replace extreme spikes with the fallback.
+    if math.fabs(lat) > max_abs:
+        lat = fb_lat
+        flags |= FLAG_LAT_OUT
+    if math.fabs(lon) > max_abs:
+        lon = fb_lon
+        flags |= FLAG_LON_OUT
+
+    if clip:
+        if lat < -90:
+            lat = -90.0
+            flags |= FLAG_LAT_CLIP
+        elif lat > 90:
+            lat = 90.0
+            flags |= FLAG_LAT_CLIP
+        if lon < -180:
+            lon = -180.0
+            flags |= FLAG_LON_CLIP
+        elif lon > 180:
+            lon = 180.0
+            flags |= FLAG_LON_CLIP
+
+    return lat, lon, flags
+
+
+@njit(cache=True)
+def bin_points(lats, lons, lat_min, lat_max, lon_min, lon_max, lat_k, lon_k, grid):
+    """
+    Count lat/lon points into ``grid`` in place (row 0 is northernmost).
+
+    Non-finite and out-of-range points are skipped. ``lat_k``/``lon_k``
+    are cells per degree; a negative value marks a degenerate range whose
+    points all land in the middle row/column.
+    """
+    rows, cols = grid.shape
+    for i in range(lats.shape[0]):
+        lat = lats[i]
+        lon = lons[i]
+        if not (math.isfinite(lat) and math.isfinite(lon)):
+            continue
+        if not (lat_min <= lat <= lat_max and lon_min <= lon <= lon_max):
+            continue
+
+        if lat_k < 0:
+            r = rows // 2
+        else:
+            r = int((lat_max - lat) * lat_k)
+            if r > rows - 1:
+                r = rows - 1
+        if lon_k < 0:
+            c = cols // 2
+        else:
+            c = int((lon - lon_min) * lon_k)
+            if c > cols - 1:
+                c = cols - 1
+        grid[r, c] += 1
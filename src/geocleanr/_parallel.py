@@ -0,0 +1,42 @@
+"""Helpers for fanning batched row work out to worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield consecutive lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("batch_size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(func: Callable[[T], R], jobs: Iterable[T], n_jobs: int) -> List[R]:
+    """
+    Run ``func`` over ``jobs`` in a process pool and return results in order.
+
+    ``func`` must be a module-level function so it pickles cleanly.
+    A negative ``n_jobs`` uses one worker per CPU; zero is rejected.
+    """
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive worker count or negative for all CPUs, not 0")
+    # Never fork the current process: thread pools started by native libraries
+    # (BLAS, numba) can deadlock in a forked child.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(
+        max_workers=None if n_jobs < 0 else n_jobs,
+        mp_context=multiprocessing.get_context(method),
+    ) as pool:
+        return list(pool.map(func, jobs, chunksize=1))
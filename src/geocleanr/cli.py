@@ -1,16 +1,81 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import csv
 import json
+import math
+import os
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Iterable, Iterator, Mapping
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, Mapping, Tuple
 
-from .validator import GeometryValidator
+import numpy as np
+
+from ._parallel import chunked, map_chunks
+from .validator import GeometryValidator, ValidationIssue
 from .fixer import CoordinateFixer
 from .reporter import ReportBuilder
 from .visualizer import AsciiHeatmap
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
+
+def _finite_or_none(value: object) -> object:
+    # orjson writes NaN and +/-inf as null; the stdlib path does the same.
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+def _stdlib_json_line(row: Mapping[str, object]) -> bytes:
+    # Same compact UTF-8 layout orjson produces, non-finite floats included.
+    try:
+        text = json.dumps(row, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite_or_none(row), separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
+
+
+if orjson is not None:
+    # Non-string keys cover csv.DictReader's None key for surplus cells.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+    def _json_line(row: Mapping[str, object]) -> bytes:
+        try:
+            return orjson.dumps(row, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers past 64 bits, which the stdlib writes as-is.
+            return _stdlib_json_line(row)
+
+    def _json_loads(line: bytes) -> object:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity and out-of-range numbers such as 1e400 only parse in json.
+            return json.loads(line)
+
+else:
+    _json_line = _stdlib_json_line
+    _json_loads = json.loads
+
+
+# Rows held in memory at once by the CLI pipeline.
+PIPELINE_BATCH_SIZE = 10_000
+
+# Write buffer for NDJSON output; large enough that flushes are rare.
+NDJSON_BUFFER_SIZE = 1 << 20
+
 
 def read_csv(path: Path) -> Iterator[dict]:
     with path.open("r", encoding="utf-8") as handle:
@@ -19,44 +84,241 @@ def read_csv(path: Path) -> Iterator[dict]:
             yield row
 
 
+def read_csv_columnar(path: Path, lat_field: str = "lat", lon_field: str = "lon") -> "pa.Table":
+    """
+    Parse the two coordinate columns of a CSV file into float64 Arrow columns.
+
+    Requires the optional ``pyarrow`` dependency. Only the coordinate
+    columns are read; an absent one comes back all-null. Raises
+    ``ValueError`` (``pyarrow.ArrowInvalid``) whenever the row-based
+    ``read_csv`` reader could see the file differently: a coordinate cell
+    that is empty, "NA" or not plain numeric (e.g. ``"12.5N"``), a ragged
+    row, or a UTF-8 byte-order mark.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    with path.open("rb") as handle:
+        if handle.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+            # DictReader keeps the BOM in the first header name; Arrow would strip it.
+            raise ValueError(f"{path} starts with a UTF-8 byte-order mark")
+
+    options = pa_csv.ConvertOptions(
+        column_types={lat_field: pa.float64(), lon_field: pa.float64()},
+        include_columns=[lat_field, lon_field],
+        include_missing_columns=True,
+        # No null spellings: "" and "NA" are unparseable (not missing) in the row path.
+        null_values=[],
+    )
+    return pa_csv.read_csv(path, convert_options=options)
+
+
+def table_columns(
+    table: "pa.Table", lat_field: str = "lat", lon_field: str = "lon"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the coordinate columns of an Arrow table as float64 arrays.
+
+    Nulls (and absent columns) become NaN, i.e. missing. A cell that parsed
+    to NaN (the text "nan") becomes inf: like ``float("nan")`` in the row
+    path it is present but never in range.
+    """
+    columns = []
+    for name in (lat_field, lon_field):
+        if name in table.column_names:
+            column = table.column(name)
+            values = column.to_numpy().astype(np.float64)
+            values[np.isnan(values) & ~column.is_null().to_numpy()] = np.inf
+            columns.append(values)
+        else:
+            columns.append(np.full(table.num_rows, np.nan))
+    return columns[0], columns[1]
+
+
 def read_ndjson(path: Path) -> Iterator[dict]:
-    with path.open("r", encoding="utf-8") as handle:
+    """
+    Yield one dict per non-blank line of a newline-delimited JSON file.
+
+    Lines are decoded with orjson when it is installed and with json
+    otherwise, so NaN/Infinity lines load either way. orjson reads integers
+    outside the 64-bit range as floats; keep such ids quoted as strings.
+    """
+    # Lines stay as bytes; both orjson and json decode UTF-8 directly.
+    with path.open("rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield _json_loads(line)
 
 
 def write_ndjson(path: Path, rows: Iterable[Mapping[str, object]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row))
-            handle.write("\n")
+    with path.open("wb", buffering=NDJSON_BUFFER_SIZE) as handle:
+        for batch in chunked(rows, PIPELINE_BATCH_SIZE):
+            _dump_rows(handle, batch)
+
+
+@contextmanager
+def _open_replacing(path: Path) -> Iterator[IO[bytes]]:
+    """
+    Open a binary handle whose contents replace ``path`` once the block succeeds.
+
+    The pipeline writes fixed rows while it is still reading the input, so
+    --write-fixed may name the input file itself; writing beside it and
+    renaming at the end leaves the input intact until the pass is done.
+    """
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp.open("wb", buffering=NDJSON_BUFFER_SIZE) as handle:
+            yield handle
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    os.replace(temp, path)
+
+
+def _dump_rows(handle: IO[bytes], rows: Iterable[Mapping[str, object]]) -> None:
+    # One write per batch: the rows are serialized to bytes and joined first.
+    handle.write(b"".join(map(_json_line, rows)))
+
+
+class PipelineAccumulator:
+    """
+    Single pass over the input for the CLI.
+
+    Each batch of rows is validated, binned into the heatmap grid and
+    fixed/written before the next batch is read, so the input is
+    traversed once and (with ``n_jobs == 1``) only one batch is held in
+    memory. Issues are yielded as they are found; the heatmap grid is
+    complete once run() has been exhausted.
+    """
+
+    def __init__(
+        self,
+        validator: GeometryValidator,
+        fixer: CoordinateFixer,
+        heatmap: AsciiHeatmap | None = None,
+        sink: IO[bytes] | None = None,
+        batch_size: int = 10_000,
+        n_jobs: int = 1,
+    ) -> None:
+        self.validator = validator
+        self.fixer = fixer
+        self.heatmap = heatmap
+        self.sink = sink
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.grid = None if heatmap is None else np.zeros((heatmap.rows, heatmap.cols), dtype=np.int64)
+
+    def run(self, rows: Iterable[dict]) -> Iterator[ValidationIssue]:
+        jobs = (
+            (self.validator, self.fixer, self.heatmap, self.sink is not None, number * self.batch_size, batch)
+            for number, batch in enumerate(chunked(rows, self.batch_size))
+        )
+        if self.n_jobs == 1:
+            results: Iterable[tuple] = map(_process_batch, jobs)
+        else:
+            results = map_chunks(_process_batch, jobs, self.n_jobs)
+
+        for issues, grid, fixed in results:
+            if grid is not None:
+                self.grid += grid
+            if fixed is not None:
+                _dump_rows(self.sink, fixed)
+            yield from issues
+
+
+def _process_batch(job: tuple) -> tuple:
+    # One fused step: validate, bin and fix a batch (module-level so it pickles for --jobs).
+    validator, fixer, heatmap, fix, start, batch = job
+    issues = validator.validate(batch, start=start)
+    # Bin the raw coordinates before fixing mutates the rows in place.
+    grid = None if heatmap is None else heatmap.count_grid(batch)
+    fixed = None
+    if fix:
+        columns = fixer.numeric_columns(batch)
+        if columns is None:
+            fixed = [fixer.fix_record(row).record for row in batch]
+        else:
+            # Homogeneous numeric batch: fix the two columns, then patch the rows.
+            lat, lon, _ = fixer.fix_arrays(*columns)
+            fixed = list(fixer.assign_columns(batch, lat, lon))
+    return issues, grid, fixed
+
+
+def _job_count(text: str) -> int:
+    # argparse type for --jobs: any non-zero integer.
+    value = int(text)
+    if value == 0:
+        raise argparse.ArgumentTypeError("must be a positive worker count or -1 for all CPUs")
+    return value
 
 
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="GeoCleanr command line interface")
     parser.add_argument("--input", required=True, help="Path to CSV or newline-delimited JSON file")
-    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "csv-legacy", "ndjson"],
+        default="csv",
+        help="csv validates through the fast columnar reader when pyarrow is installed "
+        "and only a report is requested; csv-legacy always parses row by row",
+    )
     parser.add_argument("--report", help="Path to write Markdown report (defaults to stdout)")
     parser.add_argument("--write-fixed", help="Optional path to write cleaned records as NDJSON")
     parser.add_argument("--heatmap", action="store_true", help="Print ASCII heatmap after validation")
+    parser.add_argument(
+        "--jobs",
+        type=_job_count,
+        default=1,
+        help="Worker processes for row-based validation and fixing (-1 = all CPUs)",
+    )
     args = parser.parse_args(argv)
 
     input_path = Path(args.input)
-    if args.format == "csv":
-        records = list(read_csv(input_path))
-    else:
-        records = list(read_ndjson(input_path))
-
     validator = GeometryValidator()
     fixer = CoordinateFixer()
     builder = ReportBuilder()
     heatmap = AsciiHeatmap()
 
-    issues = validator.validate(records)
-    summary = builder.build_summary(issues)
+    table = None
+    if args.format == "csv" and not (args.heatmap or args.write_fixed):
+        # Report only: the two coordinate columns are all that is needed. Rows that are
+        # written or binned always come from read_csv so other columns stay untouched.
+        try:
+            table = read_csv_columnar(input_path, validator.lat_field, validator.lon_field)
+        except (ImportError, ValueError):
+            # No pyarrow, or the file needs the row reader's string handling.
+            table = None
+
+    pipeline = None
+    with ExitStack() as stack:
+        if table is not None:
+            # Nothing needs row dicts: validate the Arrow columns directly.
+            issues: Iterable[ValidationIssue] = validator.validate_columns(
+                *table_columns(table, validator.lat_field, validator.lon_field)
+            )
+        else:
+            if args.format == "ndjson":
+                rows: Iterable[dict] = read_ndjson(input_path)
+            else:
+                rows = read_csv(input_path)
+            sink = None
+            if args.write_fixed:
+                sink = stack.enter_context(_open_replacing(Path(args.write_fixed)))
+            pipeline = PipelineAccumulator(
+                validator,
+                fixer,
+                heatmap=heatmap if args.heatmap else None,
+                sink=sink,
+                batch_size=PIPELINE_BATCH_SIZE,
+                n_jobs=args.jobs,
+            )
+            issues = pipeline.run(rows)
+
+        # Consuming the issues drives the whole read -> validate -> fix -> write pass.
+        summary = builder.build_summary(issues)
+
     report_text = builder.to_markdown(summary)
 
     if args.report:
@@ -65,14 +327,10 @@ def main(argv: list[str] | None = None) -> None:
         print(report_text)
 
     if args.heatmap:
-        visualization = heatmap.render(records)
+        visualization = heatmap.render_grid(pipeline.grid)
         print("\nASCII heatmap:\n")
         print(visualization)
 
-    if args.write_fixed:
-        fixed = [fixer.fix_record(row).record for row in records]
-        write_ndjson(Path(args.write_fixed), fixed)
-
 
 if __name__ == "__main__":  # pragma: no cover
     main()
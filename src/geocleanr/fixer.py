@@ -1,17 +1,172 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Mapping, MutableMapping, Tuple, Any, List
+import math
+from itertools import chain
+from typing import Iterable, Iterator, Mapping, MutableMapping, NamedTuple, Sequence, Tuple, Any, List
 
+import numpy as np
+
+from ._numba_kernels import (
+    FLAG_LAT_CLIP,
+    FLAG_LAT_OUT,
+    FLAG_LON_CLIP,
+    FLAG_LON_OUT,
+    FLAG_SWAP,
+    FLAG_WRAP,
+    fix_pair as _fix_pair,
+)
+from ._parallel import chunked, map_chunks
 from .validator import GeometryValidator, ValidationIssue
 
+# Fixes applied before the numeric kernel; the kernel's own bits are FLAG_SWAP..FLAG_LON_CLIP.
+FLAG_LAT_COERCED = 64
+FLAG_LAT_COERCE_FAILED = 128
+FLAG_LON_COERCED = 256
+FLAG_LON_COERCE_FAILED = 512
+FLAG_FILLED = 1024
+FLAG_LAT_FILLED = 2048
+FLAG_LON_FILLED = 4096
+
+# Fix names in the order they are applied (one side may report the same name as the other).
+_FIX_NAMES = (
+    (FLAG_LAT_COERCED, "coerced_from_string"),
+    (FLAG_LAT_COERCE_FAILED, "coerce_failed"),
+    (FLAG_LON_COERCED, "coerced_from_string"),
+    (FLAG_LON_COERCE_FAILED, "coerce_failed"),
+    (FLAG_FILLED, "filled_missing"),
+    (FLAG_LAT_FILLED, "lat_filled"),
+    (FLAG_LON_FILLED, "lon_filled"),
+    (FLAG_SWAP, "swapped_axes"),
+    (FLAG_WRAP, "lon_wrapped"),
+    (FLAG_LAT_OUT, "lat_outlier"),
+    (FLAG_LON_OUT, "lon_outlier"),
+    (FLAG_LAT_CLIP, "lat_clipped"),
+    (FLAG_LON_CLIP, "lon_clipped"),
+)
+
+
+class _FixNameTable(dict):
+    # flags -> tuple of fix names; each reachable combination is decoded once, then looked up.
+    def __missing__(self, flags: int) -> Tuple[str, ...]:
+        names = self[flags] = tuple(name for bit, name in _FIX_NAMES if flags & bit)
+        return names
+
+
+_FIX_TABLE = _FixNameTable()
+
+# Per-value coercion notes from _coerce_value; multiplying by FLAG_LAT_COERCED or
+# FLAG_LON_COERCED lifts them onto that side's two flag bits.
+_COERCED = 1
+_COERCE_FAILED = 2
+
+# Value types that can go straight into the array path without coercion.
+_NUMERIC_TYPES = (int, float)
+
+
+class _Staged(NamedTuple):
+    # A record after coercion/filling, waiting for the numeric kernel.
+    record: MutableMapping[str, Any]
+    flags: int
+    orig_lat: Any
+    orig_lon: Any
+    lat: float
+    lon: float
+
 
-@dataclass
 class FixResult:
-    # Clean record plus a small audit trail.
-    record: dict
-    fixes: list[str]
-    changes: dict[str, Tuple[Any, Any]]
+    """
+    Clean record plus a compact audit trail.
+
+    ``flags`` is a bitmask of the ``FLAG_*`` fixes that fired. The
+    ``fixes`` list and ``changes`` dict are rebuilt from it only when
+    read, so a clean row costs nothing beyond the result object itself.
+    """
+
+    __slots__ = (
+        "record", "flags", "_lat_field", "_lon_field", "_fallback",
+        "_orig_lat", "_orig_lon", "_lat", "_lon",
+    )
+
+    def __init__(
+        self,
+        record: MutableMapping[str, Any],
+        flags: int,
+        lat_field: str,
+        lon_field: str,
+        fallback: Tuple[float, float],
+        orig_lat: Any,
+        orig_lon: Any,
+        lat: float | None = None,
+        lon: float | None = None,
+    ) -> None:
+        self.record = record
+        self.flags = flags
+        # Inputs needed to replay the audit trail: the fixer settings in force, the raw
+        # values and the pair fed to the kernel. Later fixer changes do not reach here.
+        self._lat_field = lat_field
+        self._lon_field = lon_field
+        self._fallback = fallback
+        self._orig_lat = orig_lat
+        self._orig_lon = orig_lon
+        self._lat = lat
+        self._lon = lon
+
+    @property
+    def fixes(self) -> list[str]:
+        return list(_FIX_TABLE[self.flags])
+
+    @property
+    def changes(self) -> dict[str, Tuple[Any, Any]]:
+        # Rebuild the before/after pairs a step-by-step fix would have recorded; later
+        # steps overwrite earlier ones for the same field.
+        flags = self.flags
+        lat_field, lon_field, fallback = self._lat_field, self._lon_field, self._fallback
+        orig_lat, orig_lon = self._orig_lat, self._orig_lon
+        lat, lon = self._lat, self._lon
+        changes: dict[str, Tuple[Any, Any]] = {}
+
+        if flags & FLAG_LAT_COERCED and not flags & FLAG_LAT_COERCE_FAILED:
+            changes[lat_field] = (orig_lat, lat)
+        if flags & FLAG_LON_COERCED and not flags & FLAG_LON_COERCE_FAILED:
+            changes[lon_field] = (orig_lon, lon)
+        if flags & FLAG_FILLED:
+            changes[lat_field] = (orig_lat, fallback[0])
+            changes[lon_field] = (orig_lon, fallback[1])
+            return changes
+        if flags & FLAG_LAT_FILLED:
+            changes[lat_field] = (orig_lat, fallback[0])
+        if flags & FLAG_LON_FILLED:
+            changes[lon_field] = (orig_lon, fallback[1])
+
+        if flags & FLAG_SWAP:
+            lat, lon = lon, lat
+            changes[lat_field] = (orig_lat, lat)
+            changes[lon_field] = (orig_lon, lon)
+        if flags & FLAG_WRAP:
+            wrapped_lon = _wrap_longitude(lon)
+            changes[lon_field] = (lon, wrapped_lon)
+            lon = wrapped_lon
+        if flags & FLAG_LAT_OUT:
+            lat = fallback[0]
+            changes[lat_field] = (orig_lat, lat)
+        if flags & FLAG_LON_OUT:
+            lon = fallback[1]
+            changes[lon_field] = (orig_lon, lon)
+        if flags & FLAG_LAT_CLIP:
+            changes[lat_field] = (lat, -90.0 if lat < -90 else 90.0)
+        if flags & FLAG_LON_CLIP:
+            changes[lon_field] = (lon, -180.0 if lon < -180 else 180.0)
+        return changes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FixResult):
+            return NotImplemented
+        return (self.record, self.fixes, self.changes) == (other.record, other.fixes, other.changes)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"FixResult(record={self.record!r}, fixes={self.fixes!r}, changes={self.changes!r})"
 
 
 class CoordinateFixer:
@@ -32,97 +187,185 @@ class CoordinateFixer:
         self.max_abs = max_abs
         self.validator = GeometryValidator(lat_field=lat_field, lon_field=lon_field)
 
-    def fix_record(self, record: Mapping[str, Any]) -> FixResult:
-        mutable: MutableMapping[str, Any] = dict(record)
-        fixes: list[str] = []
-        changes: dict[str, Tuple[Any, Any]] = {}
+    def fix_record(self, record: MutableMapping[str, Any], copy: bool = False) -> FixResult:
+        """
+        Repair one record in place and return it with its audit trail.
+
+        Pass ``copy=True`` to leave ``record`` untouched and fix a copy instead.
+        """
+        staged = self._stage(dict(record) if copy else record)
+        if isinstance(staged, FixResult):
+            return staged
+        # Swap, wrap, outlier and clip run as one numeric kernel.
+        new_lat, new_lon, flags = _fix_pair(staged.lat, staged.lon, *self._kernel_args())
+        return self._finish(staged, new_lat, new_lon, flags)
 
-        # Pull raw values from the input record.
-        lat = mutable.get(self.lat_field)
-        lon = mutable.get(self.lon_field)
+    def fix_all(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        n_jobs: int = 1,
+        batch_size: int = 10_000,
+    ) -> List[FixResult]:
+        """
+        Fix every row and return results in input order; the input rows are not modified.
+
+        With ``n_jobs != 1`` the rows are split into ``batch_size`` chunks
+        and fixed in worker processes; a negative ``n_jobs`` uses every CPU.
+        """
+        if n_jobs != 1:
+            jobs = ((self, chunk) for chunk in chunked(rows, batch_size))
+            return list(chain.from_iterable(map_chunks(_fix_chunk, jobs, n_jobs)))
+
+        return [self.fix_record(row, copy=True) for row in rows]
+
+    def fix_arrays(
+        self, lat: np.ndarray, lon: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Repair two numeric coordinate columns without touching any rows.
+
+        Runs the same swap/wrap/outlier/clip sequence as fix_record() as
+        whole-array NumPy operations. Returns new ``(lat, lon, flags)``
+        arrays where ``flags`` is a uint8 bitmask of the ``FLAG_*`` values
+        that fired for each row. Missing values are not filled here.
+        """
+        lat = np.array(lat, dtype=np.float64)
+        lon = np.array(lon, dtype=np.float64)
+        fb_lat, fb_lon, max_abs, clip = self._kernel_args()
+
+        with np.errstate(invalid="ignore"):
+            # Mask-driven swap/wrap: no per-row branching, and the copies above are edited in place.
+            abs_lat = np.abs(lat)
+            abs_lon = np.abs(lon)
+            swap = (abs_lat > 90) & (abs_lat <= 180) & (abs_lon <= 90)
+            moved_lat = lat[swap]
+            np.copyto(lat, lon, where=swap)
+            lon[swap] = moved_lat
+
+            abs_lon = np.abs(lon)
+            wrap = (abs_lon > 180) & (abs_lon <= 360)
+            # lon - 360*floor(...) is exact in [-360, 360]; (lon + 180) % 360 can round.
+            np.copyto(lon, lon - 360 * np.floor((lon + 180) / 360), where=wrap)
+
+            lat_out = np.abs(lat) > max_abs
+            lon_out = np.abs(lon) > max_abs
+            lat[lat_out] = fb_lat
+            lon[lon_out] = fb_lon
+
+            if clip:
+                lat_clip = (lat < -90) | (lat > 90)
+                lon_clip = (lon < -180) | (lon > 180)
+                np.clip(lat, -90, 90, out=lat)
+                np.clip(lon, -180, 180, out=lon)
+            else:
+                lat_clip = lon_clip = np.zeros(len(lat), dtype=bool)
+
+        flags = np.zeros(len(lat), dtype=np.uint8)
+        for mask, bit in (
+            (swap, FLAG_SWAP),
+            (wrap, FLAG_WRAP),
+            (lat_out, FLAG_LAT_OUT),
+            (lon_out, FLAG_LON_OUT),
+            (lat_clip, FLAG_LAT_CLIP),
+            (lon_clip, FLAG_LON_CLIP),
+        ):
+            flags |= mask.view(np.uint8) * np.uint8(bit)
+        return lat, lon, flags
+
+    def numeric_columns(
+        self, rows: Sequence[Mapping[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray] | None:
+        """
+        Return the lat/lon columns as float arrays if every value is already
+        an int or float, otherwise None (the rows need per-row coercion).
+        """
+        lats = [row.get(self.lat_field) for row in rows]
+        lons = [row.get(self.lon_field) for row in rows]
+        if not all(type(value) in _NUMERIC_TYPES for value in chain(lats, lons)):
+            return None
+        return np.array(lats, dtype=np.float64), np.array(lons, dtype=np.float64)
+
+    def assign_columns(
+        self,
+        rows: Iterable[MutableMapping[str, Any]],
+        lat: np.ndarray,
+        lon: np.ndarray,
+    ) -> Iterator[MutableMapping[str, Any]]:
+        """Write fixed coordinates back into each row as it is consumed."""
+        for row, new_lat, new_lon in zip(rows, lat.tolist(), lon.tolist()):
+            row[self.lat_field] = new_lat
+            row[self.lon_field] = new_lon
+            yield row
+
+    def validate_after_fix(self, rows: Iterable[Mapping[str, Any]]) -> List[ValidationIssue]:
+        rows = list(rows)
+        columns = self.numeric_columns(rows)
+        if columns is not None:
+            lat, lon, _ = self.fix_arrays(*columns)
+            # validate() reads a NaN cell as a value that is never in range, not as missing.
+            lat[np.isnan(lat)] = np.inf
+            lon[np.isnan(lon)] = np.inf
+            return self.validator.validate_columns(lat, lon)
+        fixed = (result.record for result in self.fix_all(rows))
+        return self.validator.validate(fixed)
+
+    def _stage(self, record: MutableMapping[str, Any]) -> FixResult | _Staged:
+        # Coerce and fill missing values in place; returns a finished result when nothing
+        # is left to fix, else the pair to run through the numeric kernel.
+
+        # Pull raw values from the input record (kept for the audit trail).
+        orig_lat = record.get(self.lat_field)
+        orig_lon = record.get(self.lon_field)
 
         # Try to turn both values into floats, note any coercions.
-        lat, lat_note, lat_changed = self._coerce_value(lat)
-        lon, lon_note, lon_changed = self._coerce_value(lon)
-        fixes.extend(lat_note)
-        fixes.extend(lon_note)
-        if lat_changed:
-            changes[self.lat_field] = (record.get(self.lat_field), lat)
-        if lon_changed:
-            changes[self.lon_field] = (record.get(self.lon_field), lon)
+        lat, lat_note = self._coerce_value(orig_lat)
+        lon, lon_note = self._coerce_value(orig_lon)
+        flags = lat_note * FLAG_LAT_COERCED | lon_note * FLAG_LON_COERCED
 
         # If both are missing or broken, drop in the fallback pair.
         if lat is None and lon is None:
-            mutable[self.lat_field], mutable[self.lon_field] = self.fallback
-            fixes.append("filled_missing")
-            changes[self.lat_field] = (record.get(self.lat_field), self.fallback[0])
-            changes[self.lon_field] = (record.get(self.lon_field), self.fallback[1])
-            return FixResult(dict(mutable), fixes, changes)
+            record[self.lat_field], record[self.lon_field] = self.fallback
+            return FixResult(
+                record, flags | FLAG_FILLED, self.lat_field, self.lon_field, self.fallback,
+                orig_lat, orig_lon,
+            )
 
         # Fill only the missing side so we do not lose a good value.
         if lat is None:
             lat = self.fallback[0]
-            fixes.append("lat_filled")
-            changes[self.lat_field] = (record.get(self.lat_field), lat)
+            flags |= FLAG_LAT_FILLED
         if lon is None:
             lon = self.fallback[1]
-            fixes.append("lon_filled")
-            changes[self.lon_field] = (record.get(self.lon_field), lon)
+            flags |= FLAG_LON_FILLED
 
-        # Swap if numbers look like they are in the wrong columns.
-        swapped = self._looks_swapped(lat, lon)
-        if swapped:
-            lat, lon = lon, lat
-            fixes.append("swapped_axes")
-            changes[self.lat_field] = (record.get(self.lat_field), lat)
-            changes[self.lon_field] = (record.get(self.lon_field), lon)
-
-        # Normalize 0–360 longitudes to the usual -180–180 range.
-        wrapped_lon, wrapped = self._wrap_longitude(lon)
-        if wrapped:
-            fixes.append("lon_wrapped")
-            changes[self.lon_field] = (lon, wrapped_lon)
-        lon = wrapped_lon
-
-        # If max_abs is set, throw away extreme outliers.
-        lat, lat_outlier = self._handle_outlier(lat, self.fallback[0])
-        lon, lon_outlier = self._handle_outlier(lon, self.fallback[1])
-        if lat_outlier:
-            fixes.append("lat_outlier")
-            changes[self.lat_field] = (record.get(self.lat_field), lat)
-        if lon_outlier:
-            fixes.append("lon_outlier")
-            changes[self.lon_field] = (record.get(self.lon_field), lon)
-
-        if self.clip:
-            # Push values back into legal ranges if they are slightly off but not extreme.
-            clipped_lat = self._clip(lat, -90, 90)
-            clipped_lon = self._clip(lon, -180, 180)
-            if clipped_lat != lat:
-                fixes.append("lat_clipped")
-                changes[self.lat_field] = (lat, clipped_lat)
-            if clipped_lon != lon:
-                fixes.append("lon_clipped")
-                changes[self.lon_field] = (lon, clipped_lon)
-            lat, lon = clipped_lat, clipped_lon
-
-        mutable[self.lat_field] = lat
-        mutable[self.lon_field] = lon
-        return FixResult(dict(mutable), fixes, changes)
-
-    def fix_all(self, rows: Iterable[Mapping[str, Any]]) -> List[FixResult]:
-        return [self.fix_record(row) for row in rows]
+        return _Staged(record, flags, orig_lat, orig_lon, float(lat), float(lon))
 
-    def validate_after_fix(self, rows: Iterable[Mapping[str, Any]]) -> List[ValidationIssue]:
-        fixed = (result.record for result in self.fix_all(rows))
-        return self.validator.validate(fixed)
+    def _finish(self, staged: _Staged, new_lat: float, new_lon: float, flags: int) -> FixResult:
+        record, staged_flags, orig_lat, orig_lon, lat, lon = staged
+        record[self.lat_field] = new_lat
+        record[self.lon_field] = new_lon
+        return FixResult(
+            record, staged_flags | flags, self.lat_field, self.lon_field, self.fallback,
+            orig_lat, orig_lon, lat, lon,
+        )
 
-    def _coerce_value(self, value: Any) -> Tuple[float | None, list[str], bool]:
+    def _kernel_args(self) -> Tuple[float, float, float, bool]:
+        # Scalar settings passed to the numeric kernels (inf disables the outlier guard).
+        max_abs = math.inf if self.max_abs is None else float(self.max_abs)
+        return float(self.fallback[0]), float(self.fallback[1]), max_abs, bool(self.clip)
+
+    def _coerce_value(self, value: Any) -> Tuple[float | None, int]:
         # Normalize common string formats (spaces, comma decimals, N/S/E/W suffixes) then cast.
+        # Returns the float (or None) plus _COERCED/_COERCE_FAILED notes.
+        kind = type(value)
+        if kind is float:
+            # Clean numeric input (the usual case) skips the string handling entirely.
+            return value, 0
+        if kind is int:
+            return float(value), 0
         if value is None:
-            return None, [], False
-        original = value
-        fixes: list[str] = []
+            return None, 0
+        note = 0
         if isinstance(value, str):
             cleaned = value.strip()
             cleaned = cleaned.replace(",", ".")
@@ -143,36 +386,20 @@ class CoordinateFixer:
                     value = cleaned
             else:
                 value = cleaned
-            fixes.append("coerced_from_string")
+            note = _COERCED
         try:
             # Try the final float conversion.
-            number = float(value)
-            return number, fixes, number != original
+            return float(value), note
         except (TypeError, ValueError):
-            fixes.append("coerce_failed")
-            return None, fixes, False
-
-    def _looks_swapped(self, lat: float, lon: float) -> bool:
-        # Lat in longitude-like range and lon in latitude-like range is a common swap signal.
-        return abs(lat) > 90 and abs(lat) <= 180 and abs(lon) <= 90
-
-    def _wrap_longitude(self, lon: float) -> Tuple[float, bool]:
-        # Convert 0–360 style longitudes to -180–180 so they can be clipped/validated.
-        if -180 <= lon <= 180:
-            return lon, False
-        if -360 <= lon <= 360:
-            wrapped = ((lon + 180) % 360) - 180
-            return wrapped, True
-        return lon, False
-
-    def _handle_outlier(self, value: float, fallback_value: float) -> Tuple[float, bool]:
-        # If max_abs is set, replace extreme spikes with the fallback.
-        if self.max_abs is None:
-            return value, False
-        if abs(value) > self.max_abs:
-            return fallback_value, True
-        return value, False
-
-    def _clip(self, value: float, lower: float, upper: float) -> float:
-        # Simple numeric clamp.
-        return min(max(value, lower), upper)
+            return None, note | _COERCE_FAILED
+
+
+def _wrap_longitude(lon: float) -> float:
+    # Convert a 180-360 style longitude flagged FLAG_WRAP back into -180-180.
+    return lon - 360 * math.floor((lon + 180) / 360)
+
+
+def _fix_chunk(job: Tuple[CoordinateFixer, List[Mapping[str, Any]]]) -> List[FixResult]:
+    # Worker entry point for CoordinateFixer.fix_all(n_jobs=...).
+    fixer, rows = job
+    return fixer.fix_all(rows)
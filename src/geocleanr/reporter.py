@@ -3,8 +3,12 @@ from __future__ import annotations
 from collections import Counter
 from typing import Iterable, Mapping, Dict, Any, List
 
+from ._parallel import chunked
 from .validator import ValidationIssue
 
+# Issues counted per Counter.update() call; list input takes Counter's C fast path.
+_COUNT_CHUNK_SIZE = 4096
+
 
 class ReportBuilder:
     """
@@ -45,27 +49,27 @@ class ReportBuilder:
         Returns:
             A dictionary with aggregated statistics and samples.
         """
-        # Materialize the iterable so we can iterate multiple times
-        issues_list: List[ValidationIssue] = list(issues)
-
-        # Basic counts
-        total_issues = len(issues_list)
-        field_counts = Counter(issue.field for issue in issues_list)
-        message_counts = Counter(issue.message for issue in issues_list)
-
+        # Single pass: update every counter and collect the sample as we go,
+        # so the issues can come straight from a generator.
+        total_issues = 0
+        field_counts: Counter[str] = Counter()
+        message_counts: Counter[str] = Counter()
         # Optional: group by 'code' if the ValidationIssue has that attribute
         # (this keeps the code backward-compatible even if 'code' is missing).
         code_counts: Counter[str] = Counter()
-        for issue in issues_list:
-            code = getattr(issue, "code", None)
-            if code is not None:
-                code_counts[code] += 1
-
-        # Create a preview of the first N issues
-        sample_issues = [
-            self._format_issue(issue)
-            for issue in issues_list[: self.sample_size]
-        ]
+        sample_issues: List[str] = []
+
+        for batch in chunked(issues, _COUNT_CHUNK_SIZE):
+            # Create a preview of the first N issues
+            if total_issues < self.sample_size:
+                sample_issues.extend(
+                    self._format_issue(issue) for issue in batch[: self.sample_size - total_issues]
+                )
+            total_issues += len(batch)
+            field_counts.update([issue.field for issue in batch])
+            message_counts.update([issue.message for issue in batch])
+            codes = [getattr(issue, "code", None) for issue in batch]
+            code_counts.update([code for code in codes if code is not None])
 
         summary: Dict[str, Any] = {
             "total_issues": total_issues,
@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Iterable, Mapping, Any, List
+from itertools import chain
+from typing import Iterable, Mapping, Any, List, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+from ._parallel import chunked, map_chunks
+
+# Shared message strings so every issue of a kind points at the same object.
+_FIELD_COORDINATES = sys.intern("coordinates")
+_FIELD_PRECISION = sys.intern("precision")
+_MSG_MISSING = sys.intern("Missing latitude or longitude")
+_MSG_LAT_OOB = sys.intern("Latitude outside bounds")
+_MSG_LON_OOB = sys.intern("Longitude outside bounds")
+
+# One lat/lon record; fromiter fills both columns from a single generator.
+_PAIR_DTYPE = np.dtype([("lat", np.float64), ("lon", np.float64)])
+# With a precision rule, string cells also carry their written decimal count (-1 = not text).
+_PRECISION_DTYPE = np.dtype(
+    [("lat", np.float64), ("lon", np.float64), ("lat_text", np.int64), ("lon_text", np.int64)]
+)
+# np.round scales by 10**decimals in floating point; past this product the scaled value
+# no longer holds the digits being tested, so those cells are checked with round().
+_EXACT_ROUND_LIMIT = 2.0 ** 50
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """Small container describing what failed and where."""
 
@@ -22,52 +45,162 @@ class GeometryValidator:
         lon_field: str = "lon",
         precision: int | None = None,
     ) -> None:
-        self.lat_field = lat_field
-        self.lon_field = lon_field
+        self.lat_field = sys.intern(lat_field)
+        self.lon_field = sys.intern(lon_field)
         self.precision = precision
 
-    def validate(self, rows: Iterable[Mapping[str, Any]]) -> List[ValidationIssue]:
+    def validate(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        start: int = 0,
+        n_jobs: int = 1,
+        batch_size: int = 10_000,
+    ) -> List[ValidationIssue]:
+        """
+        Validate mapping-like rows and return issues in row order.
+
+        ``start`` is the index reported for the first row (useful when
+        validating one slice of a larger input). With ``n_jobs != 1`` the
+        rows are split into ``batch_size`` chunks and checked in worker
+        processes; a negative ``n_jobs`` uses every CPU.
+
+        With a ``precision`` rule, string cells are counted as written (the
+        digits after the last ``.``, trailing zeros dropped, so ``"12.50"``
+        has one decimal). Numbers are measured on the float value: the
+        fewest decimal places that reproduce it, so ``1e-05`` has five and
+        ``1.5e+16`` none, whatever notation repr() would use.
+        """
+        if n_jobs != 1:
+            jobs = (
+                (self, start + number * batch_size, chunk)
+                for number, chunk in enumerate(chunked(rows, batch_size))
+            )
+            return list(chain.from_iterable(map_chunks(_validate_chunk, jobs, n_jobs)))
+
+        # Pull both columns into floats in a single pass (missing -> NaN, unparseable -> inf),
+        # so a streamed iterable is consumed once and never held as a list.
+        if self.precision is not None:
+            cells = np.fromiter(
+                (self._precision_cells(row) for row in rows), dtype=_PRECISION_DTYPE
+            )
+            return self._validate_columns(
+                cells["lat"], cells["lon"], start, (cells["lat_text"], cells["lon_text"])
+            )
+        pairs = np.fromiter(
+            (
+                (self._as_float(row.get(self.lat_field)), self._as_float(row.get(self.lon_field)))
+                for row in rows
+            ),
+            dtype=_PAIR_DTYPE,
+        )
+        lat, lon = pairs["lat"], pairs["lon"]
+        return self.validate_columns(lat, lon, start=start)
+
+    def validate_columns(
+        self, lat: np.ndarray, lon: np.ndarray, start: int = 0
+    ) -> List[ValidationIssue]:
+        """Validate two float columns (NaN = missing) and return row-ordered issues."""
+        return self._validate_columns(lat, lon, start, None)
+
+    def _validate_columns(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        start: int,
+        text_decimals: Tuple[np.ndarray, np.ndarray] | None,
+    ) -> List[ValidationIssue]:
+        missing, bad_lat, bad_lon = self.validate_arrays(lat, lon)
+
+        bad_precision = np.zeros(len(missing), dtype=bool)
+        if self.precision is not None:
+            has_lat, has_lon = self._has_precision(lat), self._has_precision(lon)
+            if text_decimals is not None:
+                for has, decimals in zip((has_lat, has_lon), text_decimals):
+                    is_text = decimals >= 0
+                    has[is_text] = decimals[is_text] >= self.precision
+            bad_precision = ~(has_lat & has_lon) & ~missing
+
+        # Only rows with at least one problem need a Python-level visit.
+        lat_field, lon_field = self.lat_field, self.lon_field
+        precision_message = sys.intern(f"Expected {self.precision} decimal places")
         issues: List[ValidationIssue] = []
-        for idx, row in enumerate(rows):
-            lat = row.get(self.lat_field)
-            lon = row.get(self.lon_field)
-            if lat is None or lon is None:
-                issues.append(
-                    ValidationIssue(idx, "coordinates", "Missing latitude or longitude")
-                )
+        flagged = missing | bad_lat | bad_lon | bad_precision
+        for idx in np.flatnonzero(flagged).tolist():
+            index = start + idx
+            if missing[idx]:
+                issues.append(ValidationIssue(index, _FIELD_COORDINATES, _MSG_MISSING))
                 continue
-
-            if not self._within_range(lat, -90, 90):
-                issues.append(ValidationIssue(idx, self.lat_field, "Latitude outside bounds"))
-            if not self._within_range(lon, -180, 180):
-                issues.append(
-                    ValidationIssue(idx, self.lon_field, "Longitude outside bounds")
-                )
-
-            if self.precision is not None and not self._has_precision(lat, lon):
-                issues.append(
-                    ValidationIssue(
-                        idx,
-                        "precision",
-                        f"Expected {self.precision} decimal places",
-                    )
-                )
+            if bad_lat[idx]:
+                issues.append(ValidationIssue(index, lat_field, _MSG_LAT_OOB))
+            if bad_lon[idx]:
+                issues.append(ValidationIssue(index, lon_field, _MSG_LON_OOB))
+            if bad_precision[idx]:
+                issues.append(ValidationIssue(index, _FIELD_PRECISION, precision_message))
         return issues
 
+    def validate_arrays(
+        self, lat: np.ndarray, lon: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Range-check two float columns in one vectorized pass.
+
+        NaN marks a missing value. Returns boolean masks
+        ``(missing, bad_lat, bad_lon)``; rows flagged as missing are not
+        reported as out of bounds.
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        missing = np.isnan(lat) | np.isnan(lon)
+        with np.errstate(invalid="ignore"):
+            bad_lat = ~((lat >= -90) & (lat <= 90)) & ~missing
+            bad_lon = ~((lon >= -180) & (lon <= 180)) & ~missing
+        return missing, bad_lat, bad_lon
+
     def is_valid(self, rows: Iterable[Mapping[str, Any]]) -> bool:
         return not self.validate(rows)
 
-    def _within_range(self, value: Any, lower: float, upper: float) -> bool:
+    def _as_float(self, value: Any) -> float:
+        # None is "missing"; anything that will not parse can never be in range.
+        if value is None:
+            return np.nan
         try:
-            return lower <= float(value) <= upper
+            number = float(value)
         except (TypeError, ValueError):
-            return False
+            return np.inf
+        return np.inf if number != number else number
 
-    def _has_precision(self, lat: Any, lon: Any) -> bool:
-        return all(self._count_decimals(value) >= self.precision for value in (lat, lon))
+    def _precision_cells(self, row: Mapping[str, Any]) -> Tuple[float, float, int, int]:
+        lat, lon = row.get(self.lat_field), row.get(self.lon_field)
+        return (
+            self._as_float(lat),
+            self._as_float(lon),
+            self._count_decimals(lat) if isinstance(lat, str) else -1,
+            self._count_decimals(lon) if isinstance(lon, str) else -1,
+        )
 
-    def _count_decimals(self, value: Any) -> int:
-        text = f"{value}"
+    def _count_decimals(self, text: str) -> int:
         if "." not in text:
             return 0
         return len(text.split(".")[-1].rstrip("0"))
+
+    def _has_precision(self, values: np.ndarray) -> np.ndarray:
+        # A float shows at least p decimals exactly when rounding it to p - 1 places
+        # changes it; non-finite values have no decimals at all.
+        values = np.asarray(values, dtype=np.float64)
+        decimals = self.precision - 1
+        if decimals < 0:
+            return np.ones(len(values), dtype=bool)
+        finite = np.isfinite(values)
+        with np.errstate(invalid="ignore"):
+            has = finite & (np.round(values, decimals) != values)
+            inexact = finite & (np.abs(values) >= _EXACT_ROUND_LIMIT * 10.0 ** -decimals)
+        for idx in np.flatnonzero(inexact).tolist():
+            value = float(values[idx])
+            has[idx] = round(value, decimals) != value
+        return has
+
+
+def _validate_chunk(job: Tuple[GeometryValidator, int, List[Mapping[str, Any]]]) -> List[ValidationIssue]:
+    # Worker entry point for GeometryValidator.validate(n_jobs=...).
+    validator, start, rows = job
+    return validator.validate(rows, start=start)
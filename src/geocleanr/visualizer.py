@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Any, List, Tuple
+import sys
+from functools import lru_cache
+from typing import Iterable, Mapping, Any, Sequence, Tuple
+
+import numpy as np
+
+from ._numba_kernels import HAVE_NUMBA, bin_points
+from ._parallel import chunked
+
+# Records converted and counted at a time, so a long stream is never held whole.
+_BIN_BATCH_SIZE = 65_536
 
 
 class AsciiHeatmap:
@@ -42,8 +52,23 @@ class AsciiHeatmap:
         self.lat_min, self.lat_max = lat_range
         self.lon_min, self.lon_max = lon_range
 
+        # Cells per degree on each axis, computed once; None marks a degenerate range.
+        lat_span = self.lat_max - self.lat_min
+        lon_span = self.lon_max - self.lon_min
+        self._lat_k = rows / lat_span if lat_span > 0 else None
+        self._lon_k = cols / lon_span if lon_span > 0 else None
+
         # Characters from "no data" up to "max density"
         self._chars = ".-+*"
+        # Same characters as a byte lookup table indexed by density level 0-3.
+        self._lut = np.frombuffer(self._chars.encode("ascii"), dtype="S1")
+
+        # Legend printed under every grid; the leading newline leaves a blank line.
+        self._legend = (
+            "\nLegend: . = none, - = low, + = medium, * = high density\n"
+            f"Lat range: [{self.lat_min}, {self.lat_max}], "
+            f"Lon range: [{self.lon_min}, {self.lon_max}]"
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -55,75 +80,170 @@ class AsciiHeatmap:
         Args:
             records: An iterable of mapping-like objects (e.g. dicts),
                      each containing at least the latitude and longitude
-                     fields configured in the constructor.
+                     fields configured in the constructor. A pandas
+                     DataFrame or a structured NumPy array with those
+                     fields is read column-wise instead.
 
         Returns:
             A multiline string representing the heatmap. Each row of the
             string is a line of ASCII characters.
         """
-        grid = self._build_grid(records)
+        return self.render_grid(self._build_grid(records))
 
-        total_points = sum(sum(row) for row in grid)
-        if total_points == 0:
-            return "(no plottable coordinates)"
+    def count_grid(self, records: Iterable[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Count records per cell without rendering.
 
-        max_count = max(max(row) for row in grid) or 1
+        Grids from several batches of records can be summed and passed
+        to render_grid(), so a large input never has to be held at once.
 
-        lines: List[str] = []
+        Returns:
+            A rows x cols integer array, row 0 being the northernmost band.
+        """
+        return self._build_grid(records)
 
-        # We want "north" (higher latitude) at the top, so we render
-        # rows from highest lat (index 0) to lowest (index rows-1)
-        for r in range(self.rows):
-            row_cells = []
-            for c in range(self.cols):
-                value = grid[r][c]
-                char = self._value_to_char(value, max_count)
-                row_cells.append(char)
-            lines.append("".join(row_cells))
+    def render_grid(self, grid: np.ndarray) -> str:
+        """
+        Render a grid of cell counts (as returned by count_grid()).
 
-        # Add a simple legend at the bottom
-        lines.append("")
-        lines.append("Legend: . = none, - = low, + = medium, * = high density")
-        lines.append(
-            f"Lat range: [{self.lat_min}, {self.lat_max}], "
-            f"Lon range: [{self.lon_min}, {self.lon_max}]"
-        )
+        A list of row lists is accepted too.
 
-        return "\n".join(lines)
+        Returns:
+            The same multiline string as render().
+        """
+        grid = np.asarray(grid)
+        # Counts are never negative, so one max() reduction doubles as the empty check.
+        max_count = int(grid.max()) if grid.size else 0
+        if max_count == 0:
+            return "(no plottable coordinates)"
+
+        # Same thresholds as _value_to_char, for every cell at once and on the
+        # integer counts: each test that passes bumps the level, which then
+        # indexes the character table.
+        levels = (
+            (grid > 0).view(np.uint8)
+            + (grid > self._count_threshold(max_count, 0.33))
+            + (grid > self._count_threshold(max_count, 0.66))
+        )
+        # One byte buffer with a trailing newline column decodes the whole
+        # grid at once; row 0 of the grid is the northernmost band.
+        rows, cols = levels.shape
+        chars = np.empty((rows, cols + 1), dtype="S1")
+        chars[:, :cols] = self._lut[levels]
+        chars[:, cols] = b"\n"
+        return chars.tobytes().decode("ascii") + self._legend
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _build_grid(self, records: Iterable[Mapping[str, Any]]) -> List[List[int]]:
+    def _build_grid(self, records: Iterable[Mapping[str, Any]]) -> np.ndarray:
         """
         Bin all records into a rows x cols grid based on lat/lon.
+
+        Row 0 holds the highest latitudes so the grid prints north-up.
         """
-        # Initialize zero counts
-        grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        lat_field, lon_field = self.lat_field, self.lon_field
+        columnar = isinstance(records, np.ndarray) and records.dtype.names is not None
+        # A DataFrame can only exist once pandas is imported, so never import it here.
+        pd = sys.modules.get("pandas")
+        if columnar or (pd is not None and isinstance(records, pd.DataFrame)):
+            # Columnar input: pull the two columns directly instead of iterating rows.
+            names = records.dtype.names if columnar else records.columns
+            lat_arr, lon_arr = (
+                self._to_float(np.asarray(records[field]))
+                if field in names
+                else np.full(len(records), np.nan)
+                for field in (lat_field, lon_field)
+            )
+            return self._build_grid_from_arrays(lat_arr, lon_arr)
+
+        grid = np.zeros((self.rows, self.cols), dtype=np.int64)
+        for batch in chunked(records, _BIN_BATCH_SIZE):
+            # Records without numeric coordinates become NaN and are dropped when counting.
+            lat_arr = self._to_float([record.get(lat_field) for record in batch])
+            lon_arr = self._to_float([record.get(lon_field) for record in batch])
+            self._count_points(grid, lat_arr, lon_arr)
+        return grid
 
-        for record in records:
-            lat_raw = record.get(self.lat_field)
-            lon_raw = record.get(self.lon_field)
+    def _build_grid_from_arrays(self, lat_arr: np.ndarray, lon_arr: np.ndarray) -> np.ndarray:
+        """Bin two float columns (NaN = not plottable) into a new grid."""
+        grid = np.zeros((self.rows, self.cols), dtype=np.int64)
+        self._count_points(grid, lat_arr, lon_arr)
+        return grid
 
-            # Skip records without numeric coordinates
+    def _count_points(self, grid: np.ndarray, lat_arr: np.ndarray, lon_arr: np.ndarray) -> None:
+        """Add the in-range points of two float columns to ``grid`` in place."""
+        if HAVE_NUMBA:
+            # One compiled pass filters and counts without temporary masks.
+            bin_points(
+                lat_arr,
+                lon_arr,
+                float(self.lat_min),
+                float(self.lat_max),
+                float(self.lon_min),
+                float(self.lon_max),
+                -1.0 if self._lat_k is None else self._lat_k,
+                -1.0 if self._lon_k is None else self._lon_k,
+                grid,
+            )
+            return
+
+        # Skip coordinates outside the configured ranges
+        keep = (
+            np.isfinite(lat_arr)
+            & np.isfinite(lon_arr)
+            & (lat_arr >= self.lat_min)
+            & (lat_arr <= self.lat_max)
+            & (lon_arr >= self.lon_min)
+            & (lon_arr <= self.lon_max)
+        )
+        lat_arr = lat_arr[keep]
+        lon_arr = lon_arr[keep]
+        # Measure latitude down from lat_max so row 0 is the northernmost band.
+        row_index = self._bin_index(self.lat_max - lat_arr, self._lat_k, self.rows)
+        col_index = self._bin_index(lon_arr - self.lon_min, self._lon_k, self.cols)
+        # Count flat cell indices in one C pass (np.add.at is an unbuffered, slow scatter).
+        flat_index = row_index * self.cols + col_index
+        grid += np.bincount(flat_index, minlength=self.rows * self.cols).reshape(grid.shape)
+
+    def _to_float(self, values: Sequence[Any]) -> np.ndarray:
+        """
+        Convert raw cell values to float64, with NaN where float() would fail.
+        """
+        try:
+            # Numbers and numeric strings convert in one C loop (None -> NaN).
+            return np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+
+        pd = _import_pandas()
+        if pd is None:
+            numbers = np.full(len(values), np.nan)
+            indices = range(len(values))
+        else:
+            numbers = np.array(
+                pd.to_numeric(pd.Series(values, dtype=object), errors="coerce"), dtype=np.float64
+            )
+            # to_numeric rejects a few strings float() takes (e.g. non-ASCII digits).
+            indices = np.flatnonzero(np.isnan(numbers)).tolist()
+        for i in indices:
             try:
-                lat = float(lat_raw)
-                lon = float(lon_raw)
+                number = float(values[i])
             except (TypeError, ValueError):
                 continue
+            numbers[i] = number
+        return numbers
 
-            # Skip coordinates outside the configured ranges
-            if not (self.lat_min <= lat <= self.lat_max):
-                continue
-            if not (self.lon_min <= lon <= self.lon_max):
-                continue
-
-            r = self._scale(lat, self.lat_min, self.lat_max, self.rows, invert=True)
-            c = self._scale(lon, self.lon_min, self.lon_max, self.cols, invert=False)
-
-            grid[r][c] += 1
-
-        return grid
+    def _bin_index(self, offsets: np.ndarray, k: float | None, size: int) -> np.ndarray:
+        """
+        Vectorized _scale(): map offsets from the start of a range to [0, size-1].
+        """
+        if k is None:
+            # Degenerate range: put everything in the middle row/column
+            return np.full(len(offsets), size // 2, dtype=np.intp)
+        index = (offsets * k).astype(np.intp)
+        # Clamp to [0, size-1] in place, as _scale does per value.
+        return np.clip(index, 0, size - 1, out=index)
 
     def _scale(
         self,
@@ -150,8 +270,23 @@ class AsciiHeatmap:
             normalized = 1.0 - normalized
 
         index = int(normalized * size)
-        # Clamp to [0, size-1]
-        return max(0, min(size - 1, index))
+        # Clamp to [0, size-1] with plain int compares rather than min()/max() calls
+        if index < 0:
+            return 0
+        return size - 1 if index >= size else index
+
+    def _count_threshold(self, max_count: int, ratio: float) -> int:
+        """
+        Largest count c with c / max_count <= ratio, so that
+        ``count > threshold`` matches ``count / max_count > ratio`` exactly.
+        """
+        threshold = int(ratio * max_count)
+        # Nudge past float rounding in the estimate; the division is monotonic in c.
+        while (threshold + 1) / max_count <= ratio:
+            threshold += 1
+        while threshold > 0 and threshold / max_count > ratio:
+            threshold -= 1
+        return threshold
 
     def _value_to_char(self, value: int, max_value: int) -> str:
         """
@@ -172,3 +307,14 @@ class AsciiHeatmap:
         if ratio > 0.33:
             return self._chars[2]  # '+'
         return self._chars[1]      # '-'
+
+
+@lru_cache(maxsize=None)
+def _import_pandas() -> Any:
+    # pandas takes a noticeable share of a second to import, so only the
+    # mixed-value fallback in _to_float loads it, and only once.
+    try:
+        import pandas
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return pandas
@@ -0,0 +1,182 @@
+import copy
+import io
+import json
+
+import numpy as np
+import pytest
+
+from geocleanr import cli
+from geocleanr.cli import PipelineAccumulator, main
+from geocleanr.fixer import CoordinateFixer
+from geocleanr.reporter import ReportBuilder
+from geocleanr.validator import GeometryValidator
+from geocleanr.visualizer import AsciiHeatmap
+
+CSV_TEXT = (
+    "id,lat,lon,zip,day\n"
+    "1,10,20,02134,2024-01-02\n"
+    "2,,5,00001,2024-01-03\n"
+    "3,NA,7,x,\n"
+    "4,nan,8,y,2024-01-04\n"
+    "5,95,-181,z,2024-01-05\n"
+    "6,120,40,q,2024-01-06\n"
+)
+
+# With a batch size of 2 these alternate numeric batches (array fix) and mixed ones (per-row fix).
+NDJSON_ROWS = [
+    {"id": 1, "lat": 10.0, "lon": 20.0},
+    {"id": 2, "lat": 95.0, "lon": 10.0},
+    {"id": 3, "lat": "12,5N", "lon": "45.25W"},
+    {"id": 4, "lat": None, "lon": 5.0},
+    {"id": 5, "lat": 200.0, "lon": 40.0},
+    {"id": 6, "lat": -30.5, "lon": 190.0},
+    {"id": 7, "lat": 45.0},
+]
+
+
+def row_path(rows):
+    # What the CLI must match: validate, bin and fix the whole input in one go.
+    builder = ReportBuilder()
+    report = builder.to_markdown(builder.build_summary(GeometryValidator().validate(rows)))
+    heatmap = AsciiHeatmap().render(rows)
+    fixed = [result.record for result in CoordinateFixer().fix_all(rows)]
+    return report, heatmap, [json.loads(cli._json_line(row)) for row in fixed]
+
+
+def run_cli(tmp_path, name, *args):
+    report = tmp_path / f"{name}.md"
+    main([*args, "--report", str(report)])
+    return report.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("text", [CSV_TEXT, "lat,lon\n10,20\nnan,5\n95,-181\n"])
+def test_cli_csv_reports_match_csv_legacy(tmp_path, text):
+    source = tmp_path / "points.csv"
+    source.write_text(text, encoding="utf-8")
+
+    fast = run_cli(tmp_path, "fast", "--input", str(source), "--format", "csv")
+    legacy = run_cli(tmp_path, "legacy", "--input", str(source), "--format", "csv-legacy")
+
+    assert fast == legacy
+
+
+def test_cli_csv_write_fixed_keeps_other_columns_as_text(tmp_path):
+    source = tmp_path / "points.csv"
+    source.write_text(CSV_TEXT, encoding="utf-8")
+    outputs = {}
+    for fmt in ("csv", "csv-legacy"):
+        fixed = tmp_path / f"{fmt}.ndjson"
+        run_cli(tmp_path, fmt, "--input", str(source), "--format", fmt, "--write-fixed", str(fixed))
+        outputs[fmt] = fixed.read_text(encoding="utf-8")
+
+    assert outputs["csv"] == outputs["csv-legacy"]
+    first = json.loads(outputs["csv"].splitlines()[0])
+    assert (first["id"], first["zip"], first["day"]) == ("1", "02134", "2024-01-02")
+
+
+def test_read_ndjson_accepts_non_finite_numbers(tmp_path):
+    source = tmp_path / "points.ndjson"
+    source.write_text('{"lat":NaN,"lon":1.5}\n\n{"lat":-Infinity,"lon":1e400}\n', encoding="utf-8")
+
+    rows = list(cli.read_ndjson(source))
+
+    assert np.isnan(rows[0]["lat"]) and rows[0]["lon"] == 1.5
+    assert rows[1] == {"lat": float("-inf"), "lon": float("inf")}
+
+
+def test_cli_rejects_zero_jobs(tmp_path, capsys):
+    source = tmp_path / "points.csv"
+    source.write_text(CSV_TEXT, encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        main(["--input", str(source), "--jobs", "0"])
+    assert "--jobs" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_cli_pipeline_matches_row_path(tmp_path, capsys, monkeypatch, fmt, jobs):
+    monkeypatch.setattr(cli, "PIPELINE_BATCH_SIZE", 2)
+    source = tmp_path / f"points.{fmt}"
+    if fmt == "ndjson":
+        source.write_text("".join(json.dumps(row) + "\n" for row in NDJSON_ROWS), encoding="utf-8")
+        rows = NDJSON_ROWS
+    else:
+        source.write_text(CSV_TEXT, encoding="utf-8")
+        rows = list(cli.read_csv(source))
+    fixed = tmp_path / "fixed.ndjson"
+
+    report = run_cli(
+        tmp_path, "report", "--input", str(source), "--format", fmt,
+        "--write-fixed", str(fixed), "--heatmap", "--jobs", jobs,
+    )
+
+    expected_report, expected_heatmap, expected_fixed = row_path(rows)
+    assert report == expected_report
+    assert capsys.readouterr().out.endswith(expected_heatmap + "\n")
+    assert [json.loads(line) for line in fixed.read_text(encoding="utf-8").splitlines()] == expected_fixed
+
+
+def test_cli_write_fixed_can_overwrite_its_input(tmp_path):
+    source = tmp_path / "points.ndjson"
+    source.write_text("".join(json.dumps(row) + "\n" for row in NDJSON_ROWS), encoding="utf-8")
+
+    report = run_cli(
+        tmp_path, "report", "--input", str(source), "--format", "ndjson", "--write-fixed", str(source)
+    )
+
+    expected_report, _, expected_fixed = row_path(NDJSON_ROWS)
+    assert report == expected_report
+    assert [json.loads(line) for line in source.read_text(encoding="utf-8").splitlines()] == expected_fixed
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+
+def test_pipeline_accumulator_uses_both_fix_branches(monkeypatch):
+    fixer = CoordinateFixer()
+    calls = {"fix_arrays": 0, "fix_record": 0}
+    for name in calls:
+        method = getattr(fixer, name)
+
+        def counted(*args, _name=name, _method=method, **kwargs):
+            calls[_name] += 1
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(fixer, name, counted)
+    sink = io.BytesIO()
+    pipeline = PipelineAccumulator(
+        GeometryValidator(), fixer, heatmap=AsciiHeatmap(), sink=sink, batch_size=2
+    )
+
+    issues = list(pipeline.run(copy.deepcopy(NDJSON_ROWS)))
+
+    expected_report, _, expected_fixed = row_path(NDJSON_ROWS)
+    builder = ReportBuilder()
+    assert builder.to_markdown(builder.build_summary(issues)) == expected_report
+    assert pipeline.grid.tolist() == AsciiHeatmap().count_grid(NDJSON_ROWS).tolist()
+    assert [json.loads(line) for line in sink.getvalue().splitlines()] == expected_fixed
+    assert calls["fix_arrays"] == 2
+    assert calls["fix_record"] == 3
+
+
+def test_cli_report_only_csv_skips_the_row_reader(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "points.csv"
+    # Every cell parses as a double, so the columnar reader keeps it (no row fallback).
+    source.write_text("id,lat,lon\n1,10,20\n2,nan,5\n3,95,-181\n4,inf,3\n", encoding="utf-8")
+    legacy = run_cli(tmp_path, "legacy", "--input", str(source), "--format", "csv-legacy")
+
+    def no_rows(path):
+        raise AssertionError("report-only csv should not read rows")
+
+    monkeypatch.setattr(cli, "read_csv", no_rows)
+    assert run_cli(tmp_path, "fast", "--input", str(source), "--format", "csv") == legacy
+
+
+def test_json_line_writes_non_finite_floats_as_null():
+    row = {"lat": float("nan"), "lon": 1.5, "tags": [float("inf"), "é"], None: ["surplus"]}
+    expected = '{"lat":null,"lon":1.5,"tags":[null,"é"],"null":["surplus"]}\n'.encode("utf-8")
+
+    assert cli._stdlib_json_line(row) == expected
+    assert cli._json_line(row) == expected
+    with pytest.raises(TypeError):
+        cli._stdlib_json_line({"day": object()})
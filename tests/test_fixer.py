@@ -1,4 +1,13 @@
-from geocleanr.fixer import CoordinateFixer
+import numpy as np
+import pytest
+
+from geocleanr.fixer import (
+    FLAG_LAT_COERCED,
+    FLAG_LAT_OUT,
+    FLAG_SWAP,
+    FLAG_WRAP,
+    CoordinateFixer,
+)
 
 
 def test_coordinate_fixer_swaps_axes_and_clips():
@@ -56,3 +65,109 @@ def test_coordinate_fixer_outlier_guard_and_swap():
     outlier = fixer.fix_record({"lat": 1000, "lon": 10})
     assert outlier.record["lat"] == 1.0
     assert "lat_outlier" in outlier.fixes
+
+
+def test_coordinate_fixer_fix_all_matches_fix_record():
+    # The batched kernel must produce the same results as the per-row path.
+    fixer = CoordinateFixer(max_abs=500, fallback=(1.0, 2.0))
+    rows = [
+        {"lat": 120, "lon": 40},
+        {"lat": "45S", "lon": 350},
+        {"lat": None, "lon": None},
+        {"lat": 1000, "lon": 10},
+        {"lat": 95, "lon": -200},
+    ]
+
+    batched = fixer.fix_all(rows)
+    single = [fixer.fix_record(row) for row in rows]
+
+    assert [r.record for r in batched] == [r.record for r in single]
+    assert [r.fixes for r in batched] == [r.fixes for r in single]
+    assert [r.changes for r in batched] == [r.changes for r in single]
+
+
+def test_coordinate_fixer_validate_after_fix_reports_nan_as_out_of_bounds():
+    fixer = CoordinateFixer()
+    numeric = [{"lat": float("nan"), "lon": 1.0}, {"lat": 1.0, "lon": 2.0}]
+
+    issues = fixer.validate_after_fix(numeric)
+
+    assert [(issue.index, issue.field, issue.message) for issue in issues] == [
+        (0, "lat", "Latitude outside bounds")
+    ]
+    # A None cell sends the rows down the per-row path, which must agree.
+    assert fixer.validate_after_fix(numeric + [{"lat": None, "lon": 3.0}]) == issues
+
+
+def test_coordinate_fixer_fix_arrays_matches_fix_all():
+    fixer = CoordinateFixer(max_abs=500, fallback=(1.0, 2.0))
+    rows = [{"lat": 120, "lon": 40}, {"lat": 10, "lon": 350}, {"lat": 1000, "lon": 10}]
+
+    lat, lon, flags = fixer.fix_arrays(*fixer.numeric_columns(rows))
+
+    expected = [result.record for result in fixer.fix_all(rows)]
+    assert list(zip(lat.tolist(), lon.tolist())) == [(r["lat"], r["lon"]) for r in expected]
+    assert flags.tolist() == [FLAG_SWAP, FLAG_WRAP, FLAG_LAT_OUT]
+    assert fixer.numeric_columns([{"lat": "1", "lon": 2}]) is None
+
+
+def test_coordinate_fixer_mutates_in_place_unless_copy_requested():
+    fixer = CoordinateFixer()
+    record = {"lat": "10,5", "lon": 350}
+
+    copied = fixer.fix_record(record, copy=True)
+    assert record == {"lat": "10,5", "lon": 350}
+    assert copied.changes["lat"] == ("10,5", 10.5)
+
+    result = fixer.fix_record(record)
+    assert result.record is record
+    assert record == {"lat": 10.5, "lon": -10}
+    assert result.changes == copied.changes
+
+
+def test_coordinate_fixer_fix_all_in_worker_processes():
+    fixer = CoordinateFixer(fallback=(1.0, 2.0))
+    rows = [{"lat": 120, "lon": 40}, {"lat": None, "lon": 5}, {"lat": "45S", "lon": 350}]
+
+    parallel = fixer.fix_all(rows, n_jobs=2, batch_size=2)
+
+    assert [r.record for r in parallel] == [r.record for r in fixer.fix_all(rows)]
+
+
+def test_coordinate_fixer_rejects_zero_jobs():
+    with pytest.raises(ValueError, match="n_jobs"):
+        CoordinateFixer().fix_all([{"lat": 1, "lon": 2}], n_jobs=0)
+
+
+def test_fix_result_flags_expand_to_fixes_and_changes():
+    fixer = CoordinateFixer()
+    result = fixer.fix_record({"lat": "12,5", "lon": 350})
+
+    assert result.flags == FLAG_LAT_COERCED | FLAG_WRAP
+    assert result.fixes == ["coerced_from_string", "lon_wrapped"]
+    assert result.changes == {"lat": ("12,5", 12.5), "lon": (350, -10)}
+
+    clean = fixer.fix_record({"lat": 10.0, "lon": 20.0})
+    assert clean.flags == 0
+    assert clean.fixes == [] and clean.changes == {}
+
+
+def test_fix_result_changes_ignore_later_fixer_edits():
+    fixer = CoordinateFixer()
+    result = fixer.fix_record({"lat": None, "lon": None})
+
+    fixer.fallback = (9.0, 9.0)
+    fixer.lat_field = "latitude"
+
+    assert result.record["lat"] == 0.0
+    assert result.changes == {"lat": (None, 0.0), "lon": (None, 0.0)}
+
+
+def test_coordinate_fixer_does_not_report_nan_as_clipped():
+    fixer = CoordinateFixer()
+    result = fixer.fix_record({"lat": float("nan"), "lon": 10.0})
+
+    assert np.isnan(result.record["lat"]) and result.record["lon"] == 10.0
+    assert result.fixes == [] and result.changes == {}
+    _, _, flags = fixer.fix_arrays(np.array([np.nan]), np.array([np.nan]))
+    assert flags.tolist() == [0]
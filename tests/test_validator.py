@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from geocleanr.validator import GeometryValidator
@@ -24,3 +25,68 @@ def test_validator_precision_rule():
 
     assert validator.validate(rows)[0].field == "precision"
     assert validator.is_valid([])
+
+
+def test_validator_precision_ignores_trailing_zeros():
+    validator = GeometryValidator(precision=2)
+
+    assert validator.is_valid([{"lat": 10.25, "lon": -20.125}])
+    assert validator.validate([{"lat": 10.50, "lon": -20.125}])[0].field == "precision"
+
+
+def test_validator_precision_counts_string_cells_as_written():
+    validator = GeometryValidator(precision=2)
+
+    assert validator.is_valid([{"lat": "10.25", "lon": "-20.125"}])
+    assert validator.validate([{"lat": "10.50", "lon": "20.12"}])[0].field == "precision"
+    # Unparseable text is out of bounds, but its digits still count as written.
+    issues = validator.validate([{"lat": "12.5N", "lon": "20.12"}])
+    assert [issue.field for issue in issues] == ["lat"]
+
+
+def test_validator_precision_is_exact_at_high_precision():
+    rows = [{"lat": 45.12345678901234, "lon": -260.2102384092947}]
+
+    def fields(precision):
+        return [issue.field for issue in GeometryValidator(precision=precision).validate(rows)]
+
+    assert fields(13) == ["lon"]
+    assert fields(14) == ["lon", "precision"]
+
+
+def test_validator_precision_measures_floats_not_exponent_notation():
+    validator = GeometryValidator(precision=2)
+
+    # The original text count read "1e-05" as 0 decimals and "1.5e+16" as 5.
+    assert validator.is_valid([{"lat": 1e-05, "lon": 0.25}])
+    issues = validator.validate([{"lat": 1.5e16, "lon": 0.25}])
+    assert [issue.field for issue in issues] == ["lat", "precision"]
+
+
+def test_validator_validate_arrays_masks():
+    validator = GeometryValidator()
+    lat = np.array([10.0, np.nan, 95.0, 45.0])
+    lon = np.array([20.0, 5.0, 10.0, -181.0])
+
+    missing, bad_lat, bad_lon = validator.validate_arrays(lat, lon)
+
+    assert missing.tolist() == [False, True, False, False]
+    assert bad_lat.tolist() == [False, False, True, False]
+    assert bad_lon.tolist() == [False, False, False, True]
+
+
+def test_validator_unparseable_values_are_out_of_bounds():
+    rows = [{"lat": "abc", "lon": 10}, {"lat": 10, "lon": "20"}]
+    issues = GeometryValidator().validate(rows)
+
+    assert [(issue.index, issue.field) for issue in issues] == [(0, "lat")]
+
+
+def test_validator_in_worker_processes_keeps_row_indices():
+    rows = [{"lat": 10, "lon": 10}, {"lat": 95, "lon": 0}, {"lat": None, "lon": 1}]
+    validator = GeometryValidator()
+
+    parallel = validator.validate(rows, n_jobs=2, batch_size=1)
+
+    assert parallel == validator.validate(rows)
+    assert [issue.index for issue in parallel] == [1, 2]
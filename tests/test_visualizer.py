@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from geocleanr.visualizer import AsciiHeatmap
+
+
+def test_heatmap_renders_north_up_grid():
+    heatmap = AsciiHeatmap(rows=2, cols=4)
+    records = [{"lat": 45, "lon": -170}] * 4 + [
+        {"lat": -45, "lon": 170},
+        {"lat": "bad", "lon": 0},
+    ]
+
+    lines = heatmap.render(records).splitlines()
+
+    assert lines[0] == "*..."
+    assert lines[1] == "...-"
+    assert lines[3].startswith("Legend:")
+
+
+def test_heatmap_without_plottable_points():
+    heatmap = AsciiHeatmap()
+
+    assert heatmap.render([{"lat": None, "lon": 10}, {"lat": 95, "lon": 0}]) == (
+        "(no plottable coordinates)"
+    )
+
+
+def test_heatmap_band_edges_fall_south_and_east():
+    heatmap = AsciiHeatmap(rows=2, cols=2)
+
+    grid = heatmap.count_grid([{"lat": 0, "lon": 0}, {"lat": 90, "lon": 180}])
+
+    assert grid.tolist() == [[0, 1], [0, 1]]
+    # Interior edges too, where (lat_max - lat) * k lands on a whole band count.
+    assert AsciiHeatmap().count_grid([{"lat": 60, "lon": 0}])[1].sum() == 1
+    assert AsciiHeatmap(rows=5, cols=7).count_grid([{"lat": 54, "lon": 0}])[1].sum() == 1
+
+
+def test_heatmap_reads_structured_arrays_column_wise():
+    heatmap = AsciiHeatmap(rows=2, cols=4)
+    records = [{"lat": 45.0, "lon": -170.0}] * 4 + [{"lat": -45.0, "lon": 170.0}]
+    array = np.array(
+        [(r["lat"], r["lon"]) for r in records], dtype=[("lat", "f8"), ("lon", "f8")]
+    )
+
+    assert heatmap.render(array) == heatmap.render(records)
+
+
+def test_heatmap_reads_dataframes_column_wise():
+    pd = pytest.importorskip("pandas")
+    heatmap = AsciiHeatmap(rows=2, cols=4)
+    records = [{"lat": 45, "lon": -170}] * 4 + [{"lat": "-45", "lon": 170}, {"lat": None, "lon": 0}]
+    frame = pd.DataFrame(records, index=range(10, 16))
+
+    assert heatmap.count_grid(frame).tolist() == heatmap.count_grid(records).tolist()
+
+
+def test_heatmap_import_does_not_load_pandas():
+    code = "import sys, geocleanr.cli; assert 'pandas' not in sys.modules"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)